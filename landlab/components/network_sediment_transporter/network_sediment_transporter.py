@@ -17,7 +17,6 @@ import warnings
 
 import numpy as np
 import scipy.constants
-import xarray as xr
 
 from landlab import Component
 from landlab.components import FlowDirectorSteepest
@@ -348,6 +347,8 @@ class NetworkSedimentTransporter(Component):
         # save reference to flow director
         self._fd = flow_director
 
+        self._cache_topology()
+
         # verify and save the bed porosity.
         if not 0 <= bed_porosity < 1:
             msg = "NetworkSedimentTransporter: bed_porosity must be" "between 0 and 1"
@@ -357,6 +358,8 @@ class NetworkSedimentTransporter(Component):
         # save or create other key properties.
         self._g = g
         self._fluid_density = fluid_density
+        # constant part of the denominator of the parcel virtual velocity.
+        self._rho_1p5_g = fluid_density ** (3.0 / 2.0) * g
         self._time_idx = 0
         self._time = 0.0
         self._distance_traveled_cumulative = np.zeros(self._num_parcels)
@@ -417,6 +420,24 @@ class NetworkSedimentTransporter(Component):
         """Mean parcel density of active parcels aggregated at link."""
         return self._rhos_mean_active
 
+    def _cache_topology(self):
+        """Look up the network connectivity from the flow director.
+
+        Flow direction is fixed over the course of a run, so the nodes and
+        links upstream and downstream of each link and node only need to be
+        found once.
+        """
+        self._upstream_node_at_link = self._fd.upstream_node_at_link().copy()
+        self._downstream_node_at_link = self._fd.downstream_node_at_link().copy()
+        self._downstream_link_at_node = self._fd.link_to_flow_receiving_node.copy()
+        self._downstream_link_at_link = self._downstream_link_at_node[
+            self._downstream_node_at_link
+        ]
+
+        self._is_upstream_link = self._fd.flow_link_incoming_at_node() == 1
+        self._number_of_contributors = np.sum(self._is_upstream_link, axis=1)
+        self._links_at_node = self._grid.links_at_node
+
     def _create_new_parcel_time(self):
         """ If we are going to track parcels through time in :py:class:`~landlab.data_record.data_record.DataRecord`, we
         need to add a new time column to the parcels dataframe. This method simply
@@ -428,46 +449,61 @@ class NetworkSedimentTransporter(Component):
 
             self._parcels.add_record(time=[self._time])
 
-            self._parcels.ffill_grid_element_and_id()
-
-            # copy parcel attributes forward in time.
-            for at in self._time_variable_parcel_attributes:
+            # copy parcel attributes forward in time. The location of the
+            # parcels on the grid is copied along with the other attributes;
+            # only the new column needs to be filled, so this is used rather
+            # than DataRecord.ffill_grid_element_and_id, which loops over the
+            # entire record.
+            for at in ["grid_element", "element_id"] + (
+                self._time_variable_parcel_attributes
+            ):
                 self._parcels.dataset[at].values[
                     :, self._time_idx
                 ] = self._parcels.dataset[at].values[:, self._time_idx - 1]
 
-        self._this_timesteps_parcels = np.zeros_like(
-            self._parcels.dataset.element_id, dtype=bool
-        )
-        self._this_timesteps_parcels[:, -1] = True
-
-        parcels_off_grid = (
-            self._parcels.dataset.element_id[:, -1] == self.OUT_OF_NETWORK
-        )
-        self._this_timesteps_parcels[parcels_off_grid, -1] = False
-
         self._num_parcels = self._parcels.number_of_items
         # ^ needs to run just in case we've added more parcels
 
-    def _update_channel_slopes(self):
-        """Re-calculate channel slopes during each timestep."""
+        # copy the parcel attributes for this timestep into contiguous arrays.
+        # The DataRecord stores each attribute as an (item, time) array, so
+        # its columns are strided by the number of timesteps. Attributes that
+        # are changed during the timestep are copied back to the DataRecord.
+        self._current_element_id = self._parcels.dataset.element_id.values[
+            :, self._time_idx
+        ].copy()
+        self._current_D = self._parcels.dataset.D.values[:, self._time_idx].copy()
+        self._current_volume = self._parcels.dataset.volume.values[
+            :, self._time_idx
+        ].copy()
+        self._current_active_layer = self._parcels.dataset.active_layer.values[
+            :, self._time_idx
+        ].copy()
+        self._current_time_arrival = self._parcels.dataset.time_arrival_in_link.values[
+            :, self._time_idx
+        ].copy()
+        self._current_location_in_link = self._parcels.dataset.location_in_link.values[
+            :, self._time_idx
+        ].copy()
+        self._density = self._parcels.dataset.density.values
 
-        for i in range(self._grid.number_of_links):
+        # the link each parcel is in, as an index, shared by the per-link sums
+        # done over the course of the timestep.
+        self._current_link = self._current_element_id.astype(int)
+        self._parcels_on_network = self._current_link != self.OUT_OF_NETWORK
 
-            upstream_node_id = self._fd.upstream_node_at_link()[i]
-            downstream_node_id = self._fd.downstream_node_at_link()[i]
+    def _update_channel_slopes(self):
+        """Re-calculate channel slopes during each timestep."""
+        z = self._grid.at_node["topographic__elevation"]
 
-            self._channel_slope[i] = _recalculate_channel_slope(
-                self._grid.at_node["topographic__elevation"][upstream_node_id],
-                self._grid.at_node["topographic__elevation"][downstream_node_id],
-                self._grid.at_link["reach_length"][i],
-            )
+        self._channel_slope[:] = _recalculate_channel_slope(
+            z[self._upstream_node_at_link],
+            z[self._downstream_node_at_link],
+            self._grid.at_link["reach_length"],
+        )
 
     def _calculate_mean_D_and_rho(self):
         """Calculate mean grain size and density on each link"""
 
-        current_parcels = self._parcels.dataset.isel(time=self._time_idx)
-
         # In the first full timestep, we need to calc grain size & rho_sed.
         # Assume all parcels are in the active layer for the purposes of
         # grain size and mean sediment density calculations
@@ -476,29 +512,25 @@ class NetworkSedimentTransporter(Component):
         # has already been calculated (e.g. during 'zeroing' runs)
 
         # Calculate mean values for density and grain size (weighted by volume).
-        sel_parcels = current_parcels.where(
-            current_parcels.element_id != self.OUT_OF_NETWORK
-        )
+        on_network = self._parcels_on_network
 
-        d_weighted = sel_parcels.D * sel_parcels.volume
-        rho_weighted = sel_parcels.density * sel_parcels.volume
-        d_weighted.name = "d_weighted"
-        rho_weighted.name = "rho_weighted"
+        link = self._current_link[on_network]
+        volume = self._current_volume[on_network]
+        n_links = self._grid.number_of_links
 
-        grouped_by_element = xr.merge(
-            (sel_parcels.element_id, sel_parcels.volume, d_weighted, rho_weighted)
-        ).groupby("element_id")
-
-        d_avg = grouped_by_element.sum().d_weighted / grouped_by_element.sum().volume
-        rho_avg = (
-            grouped_by_element.sum().rho_weighted / grouped_by_element.sum().volume
-        )
+        vol_tot = _sum_at_link(link, volume, n_links)
+        d_weighted = _sum_at_link(link, self._current_D[on_network] * volume, n_links)
+        rho_weighted = _sum_at_link(link, self._density[on_network] * volume, n_links)
 
-        self._d_mean_active = np.zeros(self._grid.size("link"))
-        self._d_mean_active[d_avg.element_id.values.astype(int)] = d_avg.values
+        # links without parcels are given a mean of zero.
+        has_parcels = np.bincount(link, minlength=n_links) > 0
 
-        self._rhos_mean_active = np.zeros(self._grid.size("link"))
-        self._rhos_mean_active[rho_avg.element_id.values.astype(int)] = rho_avg.values
+        self._d_mean_active = np.divide(
+            d_weighted, vol_tot, out=np.zeros(n_links), where=has_parcels
+        )
+        self._rhos_mean_active = np.divide(
+            rho_weighted, vol_tot, out=np.zeros(n_links), where=has_parcels
+        )
 
     def _partition_active_and_storage_layers(self, **kwds):
         """For each parcel in the network, determines whether it is in the
@@ -506,12 +538,12 @@ class NetworkSedimentTransporter(Component):
         elevations.
 
         """
-        self._vol_tot = self._parcels.calc_aggregate_value(
-            np.sum,
-            "volume",
-            at="link",
-            filter_array=self._this_timesteps_parcels,
-            fill_value=0.0,
+        n_links = self._grid.number_of_links
+        current_link = self._current_link
+        on_network = self._parcels_on_network
+
+        self._vol_tot = _sum_at_link(
+            current_link[on_network], self._current_volume[on_network], n_links
         )
 
         if self._active_layer_method == "WongParker":
@@ -523,24 +555,25 @@ class NetworkSedimentTransporter(Component):
             # active layer.
 
             # calculate tau
-            tau = (
-                self._fluid_density
-                * self._g
-                * self._grid.at_link["channel_slope"]
-                * self._grid.at_link["flow_depth"]
-            )
+            tau = self._fluid_density * self._g * self._grid.at_link["channel_slope"]
+            tau *= self._grid.at_link["flow_depth"]
 
-            # calcuate taustar
-            taustar = tau / (
+            # calcuate taustar (in place, reusing tau)
+            taustar = tau
+            taustar /= (
                 (self._rhos_mean_active - self._fluid_density)
                 * self._g
                 * self._d_mean_active
             )
 
-            # calculate active layer thickness
-            self._active_layer_thickness = (
-                0.515 * self._d_mean_active * (3.09 * (taustar - 0.0549) ** 0.56)
-            )  # in units of m
+            # calculate active layer thickness (in place, reusing taustar)
+            excess_taustar = taustar
+            excess_taustar -= 0.0549
+            excess_taustar **= 0.56
+            excess_taustar *= 3.09
+
+            self._active_layer_thickness = 0.515 * self._d_mean_active
+            self._active_layer_thickness *= excess_taustar  # in units of m
 
         elif self._active_layer_method == "GrainSizeDependent":
             # Set all active layers to a multiple of the lnk mean grain size
@@ -555,13 +588,14 @@ class NetworkSedimentTransporter(Component):
         # If links have no parcels, we still need to assign them an active layer
         # thickness..
         links_with_no_active_layer = np.isnan(self._active_layer_thickness)
-        self._active_layer_thickness[links_with_no_active_layer] = np.mean(
-            self._active_layer_thickness[links_with_no_active_layer == 0]
-        )  # assign links with no parcels an average value
 
-        if np.sum(np.isfinite(self._active_layer_thickness)) == 0:
+        if np.all(links_with_no_active_layer):
             self._active_layer_thickness.fill(_INIT_ACTIVE_LAYER_THICKNESS)
             # handles the case of the first timestep -- assigns a modest value
+        elif np.any(links_with_no_active_layer):
+            self._active_layer_thickness[links_with_no_active_layer] = np.mean(
+                self._active_layer_thickness[~links_with_no_active_layer]
+            )  # assign links with no parcels an average value
 
         capacity = (
             self._grid.at_link["channel_width"]
@@ -569,51 +603,49 @@ class NetworkSedimentTransporter(Component):
             * self._active_layer_thickness
         )  # in units of m^3
 
-        active_inactive = _INACTIVE * np.ones(self._num_parcels)
+        time_arrival = self._current_time_arrival
+        volumes = self._current_volume
 
-        current_link = self._parcels.dataset.element_id.values[:, -1].astype(int)
-        time_arrival = self._parcels.dataset.time_arrival_in_link.values[:, -1]
-        volumes = self._parcels.dataset.volume.values[:, -1]
-
-        for i in range(self._grid.number_of_links):
-
-            if (
-                self._vol_tot[i] > 0
-            ):  # only do this check capacity if parcels are in link
-
-                # First In Last Out.
-
-                # Find parcels on this link.
-                this_links_parcels = np.where(current_link == i)[0]
-
-                # sort them by arrival time.
-                time_arrival_sort = np.flip(
-                    np.argsort(time_arrival[this_links_parcels], 0,)
-                )
-                parcel_id_time_sorted = this_links_parcels[time_arrival_sort]
-
-                # calculate the cumulative volume (in sorted order).
-                cumvol = np.cumsum(volumes[parcel_id_time_sorted])
-
-                # determine which parcels are within capacity and set those to
-                # active.
-                make_active = parcel_id_time_sorted[cumvol <= capacity[i]]
+        # First In Last Out. Sort the parcels on the network by link and,
+        # within each link, from the most to the least recently arrived. The
+        # ascending sort is reversed (rather than sorting on -time_arrival) so
+        # that parcels with the same arrival time keep their previous order.
+        parcel_id = np.flatnonzero(on_network)
+        parcel_id_time_sorted = parcel_id[
+            np.lexsort((time_arrival[parcel_id], current_link[parcel_id]))[::-1]
+        ]
+        link_sorted = current_link[parcel_id_time_sorted]
+        volume_sorted = volumes[parcel_id_time_sorted]
+
+        # calculate the cumulative volume (in sorted order) on each link by
+        # removing, from the running total, the volume on the links before it.
+        cumvol = np.cumsum(volume_sorted)
+        is_first_on_link = np.ones(len(link_sorted), dtype=bool)
+        is_first_on_link[1:] = link_sorted[1:] != link_sorted[:-1]
+        volume_before_link = (cumvol - volume_sorted)[is_first_on_link]
+        cumvol -= volume_before_link[np.cumsum(is_first_on_link) - 1]
+
+        # determine which parcels are within capacity and set those to
+        # active. Only check capacity if parcels are in link.
+        make_active = parcel_id_time_sorted[
+            (cumvol <= capacity[link_sorted]) & (self._vol_tot[link_sorted] > 0)
+        ]
 
-                active_inactive[make_active] = _ACTIVE
+        # parcels out of network, or beyond the capacity of their link, are
+        # inactive.
+        is_active = np.zeros(self._num_parcels, dtype=bool)
+        is_active[make_active] = True
 
-        self._parcels.dataset.active_layer[:, -1] = active_inactive
+        self._current_active_layer[:] = np.where(is_active, _ACTIVE, _INACTIVE)
+        self._parcels.dataset.active_layer.values[
+            :, self._time_idx
+        ] = self._current_active_layer
 
         # set active here. reference it below in wilcock crowe
-        self._active_parcel_records = (
-            self._parcels.dataset.active_layer == _ACTIVE
-        ) * (self._this_timesteps_parcels)
+        self._active_parcels = is_active
 
-        self._vol_act = self._parcels.calc_aggregate_value(
-            np.sum,
-            "volume",
-            at="link",
-            filter_array=self._active_parcel_records,
-            fill_value=0.0,
+        self._vol_act = _sum_at_link(
+            current_link[is_active], volumes[is_active], n_links
         )
 
         self._vol_stor = (self._vol_tot - self._vol_act) / (1 - self._bed_porosity)
@@ -623,66 +655,45 @@ class NetworkSedimentTransporter(Component):
         timestep and additions from this timestep.
         """
 
-        number_of_contributors = np.sum(
-            self._fd.flow_link_incoming_at_node() == 1, axis=1
+        is_upstream_link = self._is_upstream_link
+        downstream_link_id = self._downstream_link_at_node
+
+        width = self._grid.at_link["channel_width"]
+        length = self._grid.at_link["reach_length"]
+
+        # widths and lengths of the links flowing into each node, padded with
+        # zeros where a node has fewer than the maximum number of links.
+        width_of_upstream_links = np.where(
+            is_upstream_link, width[self._links_at_node], 0.0
         )
-        downstream_link_id = self._fd.link_to_flow_receiving_node
-        # USED TO BE      downstream_link_id = self._fd.link_to_flow_receiving_node[
-        #            self._fd.downstream_node_at_link()
-        #        ]
-        upstream_contributing_links_at_node = np.where(
-            self._fd.flow_link_incoming_at_node() == 1, self._grid.links_at_node, -1
+        length_of_upstream_links = np.where(
+            is_upstream_link, length[self._links_at_node], 0.0
         )
 
-        # Update the node topographic elevations depending on the quantity of stored sediment
-        for n in range(self._grid.number_of_nodes):
-
-            if number_of_contributors[n] > 0:  # we don't update head node elevations
-
-                upstream_links = upstream_contributing_links_at_node[n]
-                real_upstream_links = upstream_links[
-                    upstream_links != self._grid.BAD_INDEX
-                ]
-                width_of_upstream_links = self._grid.at_link["channel_width"][
-                    real_upstream_links
-                ]
-                length_of_upstream_links = self._grid.at_link["reach_length"][
-                    real_upstream_links
-                ]
-
-                #                ALERT: Moved this to the "else" statement below. AP 11/11/19
-                #                length_of_downstream_link = self._grid.at_link["reach_length"][
-                #                    downstream_link_id
-                #                ][n]
-                #                width_of_downstream_link = self._grid.at_link["channel_width"][
-                #                    downstream_link_id
-                #                ][n]
-
-                if (
-                    downstream_link_id[n] == self._grid.BAD_INDEX
-                ):  # I'm sure there's a better way to do this, but...
-                    length_of_downstream_link = 0
-                    width_of_downstream_link = 0
-                else:
-                    length_of_downstream_link = self._grid.at_link["reach_length"][
-                        downstream_link_id
-                    ][n]
-                    width_of_downstream_link = self._grid.at_link["channel_width"][
-                        downstream_link_id
-                    ][n]
-
-                alluvium__depth = _calculate_alluvium_depth(
-                    self._vol_stor[downstream_link_id][n],
-                    width_of_upstream_links,
-                    length_of_upstream_links,
-                    width_of_downstream_link,
-                    length_of_downstream_link,
-                    self._bed_porosity,
-                )
+        has_downstream_link = downstream_link_id != self._grid.BAD_INDEX
+        width_of_downstream_link = np.where(
+            has_downstream_link, width[downstream_link_id], 0.0
+        )
+        length_of_downstream_link = np.where(
+            has_downstream_link, length[downstream_link_id], 0.0
+        )
 
-                self._grid.at_node["topographic__elevation"][n] = (
-                    self._grid.at_node["bedrock__elevation"][n] + alluvium__depth
-                )
+        # Update the node topographic elevations depending on the quantity of
+        # stored sediment. We don't update head node elevations.
+        update = self._number_of_contributors > 0
+
+        alluvium__depth = _calculate_alluvium_depth(
+            self._vol_stor[downstream_link_id][update],
+            width_of_upstream_links[update],
+            length_of_upstream_links[update],
+            width_of_downstream_link[update],
+            length_of_downstream_link[update],
+            self._bed_porosity,
+        )
+
+        self._grid.at_node["topographic__elevation"][update] = (
+            self._grid.at_node["bedrock__elevation"][update] + alluvium__depth
+        )
 
     def _calc_transport_wilcock_crowe(self):
         """Method to determine the transport time for each parcel in the active
@@ -695,109 +706,87 @@ class NetworkSedimentTransporter(Component):
 
         # parcel attribute arrays from DataRecord
 
-        Darray = self._parcels.dataset.D[:, self._time_idx]
-        Activearray = self._parcels.dataset.active_layer[:, self._time_idx].values
-        Rhoarray = self._parcels.dataset.density.values
-        Volarray = self._parcels.dataset.volume[:, self._time_idx].values
-        Linkarray = self._parcels.dataset.element_id[
-            :, self._time_idx
-        ].values  # link that the parcel is currently in
-
-        R = (Rhoarray - self._fluid_density) / self._fluid_density
+        Darray = self._current_D
+        Rhoarray = self._density
+        Volarray = self._current_volume
+        Linkarray = self._current_link  # link that the parcel is currently in
+        n_links = self._grid.number_of_links
 
-        # parcel attribute arrays to populate below
-        frac_sand_array = np.zeros(self._num_parcels)
-        vol_act_array = np.zeros(self._num_parcels)
-        Sarray = np.zeros(self._num_parcels)
-        Harray = np.zeros(self._num_parcels)
-        Larray = np.zeros(self._num_parcels)
-        D_mean_activearray = np.zeros(self._num_parcels) * (np.nan)
-        active_layer_thickness_array = np.zeros(self._num_parcels) * np.nan
-        #        rhos_mean_active = np.zeros(self._num_parcels)
-        #        rhos_mean_active.fill(np.nan)
+        # gather the attributes of the active parcels once
+        active_here = np.flatnonzero(self._active_parcels)
+        active_link = Linkarray[active_here]
+        vol_act_i = Volarray[active_here]
+        D = Darray[active_here]
+        rhos = Rhoarray[active_here]
 
         # find active sand
-        findactivesand = (
-            self._parcels.dataset.D < _SAND_SIZE
-        ) * self._active_parcel_records  # since find active already sets all prior timesteps to False, we can use D for all timesteps here.
-
-        vol_act_sand = self._parcels.calc_aggregate_value(
-            np.sum, "volume", at="link", filter_array=findactivesand, fill_value=0.0
+        active_sand = D < _SAND_SIZE
+        vol_act_sand = _sum_at_link(
+            active_link[active_sand], vol_act_i[active_sand], n_links
         )
 
-        frac_sand = np.zeros_like(self._vol_act)
-        frac_sand[self._vol_act != 0.0] = (
-            vol_act_sand[self._vol_act != 0.0] / self._vol_act[self._vol_act != 0.0]
+        frac_sand = np.divide(
+            vol_act_sand,
+            self._vol_act,
+            out=np.zeros(n_links),
+            where=self._vol_act != 0.0,
         )
-        frac_sand[np.isnan(frac_sand)] = 0.0
-
-        # Calc attributes for each link, map to parcel arrays
-        for i in range(self._grid.number_of_links):
-
-            active_here = np.nonzero(
-                np.logical_and(Linkarray == i, Activearray == _ACTIVE)
-            )[0]
-            d_act_i = Darray[active_here]
-            vol_act_i = Volarray[active_here]
-            rhos_act_i = Rhoarray[active_here]
-            vol_act_tot_i = np.sum(vol_act_i)
-
-            self._d_mean_active[i] = np.sum(d_act_i * vol_act_i) / (vol_act_tot_i)
-            if vol_act_tot_i > 0:
-                self._rhos_mean_active[i] = np.sum(rhos_act_i * vol_act_i) / (
-                    vol_act_tot_i
-                )
-            else:
-                self._rhos_mean_active[i] = np.nan
-            D_mean_activearray[Linkarray == i] = self._d_mean_active[i]
-            frac_sand_array[Linkarray == i] = frac_sand[i]
-            vol_act_array[Linkarray == i] = self._vol_act[i]
-            Sarray[Linkarray == i] = self._grid.at_link["channel_slope"][i]
-            Harray[Linkarray == i] = self._grid.at_link["flow_depth"][i]
-            Larray[Linkarray == i] = self._grid.at_link["reach_length"][i]
-            active_layer_thickness_array[Linkarray == i] = self._active_layer_thickness[
-                i
-            ]
 
-        # Wilcock and Crowe calculate transport for all parcels (active and inactive)
-        taursg = _calculate_reference_shear_stress(
-            self._fluid_density, R, self._g, D_mean_activearray, frac_sand_array
-        )
+        # Calc volume-weighted mean grain size and density of the active
+        # parcels on each link. The active volume on each link was summed
+        # when the active layer was found.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._d_mean_active = (
+                _sum_at_link(active_link, D * vol_act_i, n_links) / self._vol_act
+            )
+            self._rhos_mean_active = (
+                _sum_at_link(active_link, rhos * vol_act_i, n_links) / self._vol_act
+            )
 
-        frac_parcel = np.nan * np.zeros_like(Volarray)
-        frac_parcel[vol_act_array != 0.0] = (
-            Volarray[vol_act_array != 0.0] / vol_act_array[vol_act_array != 0.0]
+        # only parcels in the active layer move, so transport is only
+        # calculated for those. Map link attributes to the active parcels.
+        D_mean_activearray = self._d_mean_active[active_link]
+        frac_sand_array = frac_sand[active_link]
+        vol_act_array = self._vol_act[active_link]
+        # shear stress only varies by link, so calculate it once per link.
+        tau_at_link = (
+            self._fluid_density
+            * self._g
+            * self._grid.at_link["flow_depth"]
+            * self._grid.at_link["channel_slope"]
         )
+        tau = tau_at_link[active_link]
+        active_layer_thickness_array = self._active_layer_thickness[active_link]
 
-        b = 0.67 / (1.0 + np.exp(1.5 - Darray / D_mean_activearray))
+        R = (rhos - self._fluid_density) / self._fluid_density
 
-        tau = self._fluid_density * self._g * Harray * Sarray
-        tau = np.atleast_1d(tau)
-
-        taur = taursg * (Darray / D_mean_activearray) ** b
-        tautaur = tau / taur
-        tautaur_cplx = tautaur.astype(np.complex128)
-        # ^ work around needed b/c np fails with non-integer powers of negative numbers
+        taursg = _calculate_reference_shear_stress(
+            self._fluid_density, R, self._g, D_mean_activearray, frac_sand_array
+        )
 
-        W = 0.002 * np.power(tautaur_cplx.real, 7.5)
-        W[tautaur >= 1.35] = 14 * np.power(
-            (1 - (0.894 / np.sqrt(tautaur_cplx.real[tautaur >= 1.35]))), 4.5
+        frac_parcel = np.divide(
+            vol_act_i,
+            vol_act_array,
+            out=np.full_like(vol_act_i, np.nan),
+            where=vol_act_array != 0.0,
         )
 
-        active_parcel_idx = Activearray == _ACTIVE
-
-        # compute parcel virtual velocity, m/s
-        self._pvelocity[active_parcel_idx] = (
-            W.real[active_parcel_idx]
-            * (tau[active_parcel_idx] ** (3.0 / 2.0))
-            * frac_parcel[active_parcel_idx]
-            / (self._fluid_density ** (3.0 / 2.0))
-            / self._g
-            / R[active_parcel_idx]
-            / active_layer_thickness_array[active_parcel_idx]
+        W = _calculate_transport_rate(tau, taursg, D, D_mean_activearray)
+
+        # compute parcel virtual velocity, m/s. Inactive parcels keep a
+        # velocity of zero. Operations are done in place to avoid a temporary
+        # array for each term.
+        pvelocity = tau ** (3.0 / 2.0)
+        pvelocity *= W
+        pvelocity *= frac_parcel
+        pvelocity /= self._rho_1p5_g
+        pvelocity /= R
+        pvelocity /= active_layer_thickness_array
+        np.nan_to_num(
+            pvelocity, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf
         )
 
-        self._pvelocity[np.isnan(self._pvelocity)] = 0.0
+        self._pvelocity[active_here] = pvelocity
 
         if np.max(self._pvelocity) > 1:
             warnings.warn(
@@ -814,11 +803,11 @@ class NetworkSedimentTransporter(Component):
         layer.
         """
         # determine where parcels are starting
-        current_link = self._parcels.dataset.element_id.values[:, -1].astype(int)
+        current_link = self._current_link.copy()
         self.current_link = current_link
 
         # determine location within link where parcels are starting.
-        location_in_link = self._parcels.dataset.location_in_link.values[:, -1]
+        location_in_link = self._current_location_in_link
 
         # determine how far each parcel needs to travel this timestep.
         distance_to_travel_this_timestep = self._pvelocity * dt
@@ -827,132 +816,109 @@ class NetworkSedimentTransporter(Component):
         # velocity as in the current link perhaps modify in the future
 
         # Accumulate the total distance traveled by a parcel for abrasion rate
-        # calculations.
-        if np.size(self._distance_traveled_cumulative) != np.size(
-            distance_to_travel_this_timestep
-        ):
-            dist_array = distance_to_travel_this_timestep
-            dist_array[: self._num_parcels] += distance_to_travel_this_timestep
-            self._distance_traveled_cumulative = dist_array
-        else:
-            self._distance_traveled_cumulative += distance_to_travel_this_timestep
-            # ^ accumulates total distanced traveled for testing abrasion
+        # calculations. Parcels added since the last timestep start from zero.
+        n_new_parcels = self._num_parcels - self._distance_traveled_cumulative.size
+        if n_new_parcels > 0:
+            self._distance_traveled_cumulative = np.concatenate(
+                (self._distance_traveled_cumulative, np.zeros(n_new_parcels))
+            )
+        self._distance_traveled_cumulative += distance_to_travel_this_timestep
 
         # active parcels on the network:
-        in_network = (
-            self._parcels.dataset.element_id.values[:, self._time_idx]
-            != self.OUT_OF_NETWORK
+        active_parcel_ids = np.flatnonzero(
+            self._parcels_on_network & (distance_to_travel_this_timestep > 0.0)
         )
-        active = distance_to_travel_this_timestep > 0.0
-        active_parcel_ids = np.nonzero(in_network * active)[0]
 
-        distance_left_to_travel = distance_to_travel_this_timestep.copy()
-        while np.any(distance_left_to_travel > 0.0):
+        # Step 1: Move parcels downstream. Only the parcels that are moving
+        # are routed; each pass of the loop advances those that pass through
+        # their current link into the next link downstream.
+        reach_length = self._grid.at_link["reach_length"]
 
-            # Step 1: Move parcels downstream.
-            on_network = current_link != self.OUT_OF_NETWORK
+        link = current_link[active_parcel_ids]
+        location = location_in_link[active_parcel_ids]
+        distance_left_to_travel = distance_to_travel_this_timestep[active_parcel_ids]
 
-            # Get current link lengths:
-            current_link_lengths = self._grid.at_link["reach_length"][current_link]
+        still_moving = np.arange(len(active_parcel_ids))
+        while len(still_moving) > 0:
+            current_link_lengths = reach_length[link[still_moving]]
 
             # Determine where they are in the current link.
             distance_to_exit_current_link = current_link_lengths * (
-                1.0 - location_in_link
+                1.0 - location[still_moving]
             )
 
             # Identify which ones will come to rest in the current link.
             rest_this_link = (
-                (distance_left_to_travel < distance_to_exit_current_link)
-                * on_network
-                * (distance_left_to_travel > 0.0)
+                distance_left_to_travel[still_moving] < distance_to_exit_current_link
             )
 
-            # Deal with those staying in the current link.
-            if np.any(rest_this_link):
-                # print('  {x} coming to rest'.format(x=np.sum(rest_this_link)))
-
-                # for those staying in this link, calculate the location in link
-                # (note that this is a proportional distance). AND change distance_left_to_travel to 0.0
-                location_in_link[rest_this_link] = 1.0 - (
-                    (
-                        distance_to_exit_current_link[rest_this_link]
-                        - distance_left_to_travel[rest_this_link]
-                    )
-                    / current_link_lengths[rest_this_link]
+            # for those staying in this link, calculate the location in link
+            # (note that this is a proportional distance).
+            at_rest = still_moving[rest_this_link]
+            location[at_rest] = 1.0 - (
+                (
+                    distance_to_exit_current_link[rest_this_link]
+                    - distance_left_to_travel[at_rest]
                 )
-
-                distance_left_to_travel[rest_this_link] = 0.0
-
-            # Deal with those moving to a downstream link.
-            moving_downstream = (
-                (distance_left_to_travel >= distance_to_exit_current_link)
-                * on_network
-                * (distance_left_to_travel > 0.0)
+                / current_link_lengths[rest_this_link]
             )
-            if np.any(moving_downstream):
-                # print('  {x} next link'.format(x=np.sum(moving_downstream)))
-                # change location in link to 0
-                location_in_link[moving_downstream] = 0.0
-
-                # decrease distance to travel.
-                distance_left_to_travel[
-                    moving_downstream
-                ] -= distance_to_exit_current_link[moving_downstream]
-
-                # change current link to the downstream link.
-
-                # get the downstream link at link:
-                downstream_node = self._fd.downstream_node_at_link()[current_link]
-                downstream_link = self._fd.link_to_flow_receiving_node[downstream_node]
 
-                # assign new values to current link.
-                current_link[moving_downstream] = downstream_link[moving_downstream]
+            # Deal with those moving to a downstream link: they start at the
+            # top of the downstream link with less distance to travel.
+            moving_downstream = still_moving[~rest_this_link]
+            distance_left_to_travel[
+                moving_downstream
+            ] -= distance_to_exit_current_link[~rest_this_link]
+            location[moving_downstream] = 0.0
+            link[moving_downstream] = self._downstream_link_at_link[
+                link[moving_downstream]
+            ]
 
-                # find and address those links who have moved out of network.
-                moved_oon = downstream_link == self._grid.BAD_INDEX
+            # find and address those parcels that have moved out of network.
+            moved_oon = link[moving_downstream] == self._grid.BAD_INDEX
+            link[moving_downstream[moved_oon]] = self.OUT_OF_NETWORK
+            location[moving_downstream[moved_oon]] = np.nan
 
-                if np.any(moved_oon):
-                    # print('  {x} exiting network'.format(x=np.sum(moved_oon)))
+            still_moving = moving_downstream[~moved_oon]
 
-                    current_link[moved_oon] = self.OUT_OF_NETWORK
-                    # assign location in link of np.nan to those which moved oon
-                    location_in_link[moved_oon] = np.nan
-                    distance_left_to_travel[moved_oon] = 0.0
+        current_link[active_parcel_ids] = link
+        location_in_link[active_parcel_ids] = location
 
         # Step 2: Parcel is at rest... Now update its information.
 
         # reduce D and volume due to abrasion
+        starting_volume = self._current_volume[active_parcel_ids]
+
         vol = _calculate_parcel_volume_post_abrasion(
-            self._parcels.dataset.volume[active_parcel_ids, self._time_idx],
+            starting_volume,
             distance_to_travel_this_timestep[active_parcel_ids],
-            self._parcels.dataset.abrasion_rate[active_parcel_ids],
+            self._parcels.dataset.abrasion_rate.values[active_parcel_ids],
         )
 
         D = _calculate_parcel_grain_diameter_post_abrasion(
-            self._parcels.dataset.D[active_parcel_ids, self._time_idx],
-            self._parcels.dataset.volume[active_parcel_ids, self._time_idx],
-            vol,
+            self._current_D[active_parcel_ids], starting_volume, vol
         )
 
         # update parcel attributes
-
-        # arrival time in link
-        self._parcels.dataset.time_arrival_in_link[
-            active_parcel_ids, self._time_idx
-        ] = self._time_idx
+        ds = self._parcels.dataset
 
         # location in link
-        self._parcels.dataset.location_in_link[
+        ds.location_in_link.values[
             active_parcel_ids, self._time_idx
         ] = location_in_link[active_parcel_ids]
 
-        self._parcels.dataset.element_id[
+        # arrival time in link
+        ds.time_arrival_in_link.values[
             active_parcel_ids, self._time_idx
-        ] = current_link[active_parcel_ids]
+        ] = self._time_idx
+
+        ds.element_id.values[active_parcel_ids, self._time_idx] = current_link[
+            active_parcel_ids
+        ]
         #                self._parcels.dataset.active_layer[p, self._time_idx] = 1
         # ^ reset to 1 (active) to be recomputed/determined at next timestep
-        self._parcels.dataset.D[active_parcel_ids, self._time_idx] = D
-        self._parcels.dataset.volume[active_parcel_ids, self._time_idx] = vol
+        ds.D.values[active_parcel_ids, self._time_idx] = D
+        ds.volume.values[active_parcel_ids, self._time_idx] = vol
 
     def run_one_step(self, dt):
         """Run NetworkSedimentTransporter forward in time.
@@ -981,7 +947,7 @@ class NetworkSedimentTransporter(Component):
         self._time_idx += 1
         self._create_new_parcel_time()
 
-        if self._this_timesteps_parcels.any():
+        if self._parcels_on_network.any():
             self._partition_active_and_storage_layers()
             self._adjust_node_elevation()
             self._update_channel_slopes()
@@ -1001,11 +967,11 @@ def _recalculate_channel_slope(z_up, z_down, dx, threshold=1e-4):
 
     Parameters
     ----------
-    z_up : float
+    z_up : float or ndarray
         Upstream elevation.
-    z_down : float
+    z_down : float or ndarray
         Downstream elevation.
-    dz : float
+    dz : float or ndarray
         Distance.
 
     Examples
@@ -1020,22 +986,69 @@ def _recalculate_channel_slope(z_up, z_down, dx, threshold=1e-4):
     ...     _recalculate_channel_slope(0., 10., 10.)
     0.0
 
+    Slopes can be calculated for many links at once.
+
+    >>> _recalculate_channel_slope(
+    ...     np.array([10., 0., 5.]),
+    ...     np.array([0., 0., 4.]),
+    ...     np.array([10., 10., 2.]),
+    ...     threshold=0.1,
+    ... )
+    array([ 1. ,  0.1,  0.5])
+
     """
     chan_slope = (z_up - z_down) / dx
+    is_negative = chan_slope < 0.0
 
-    if chan_slope < 0.0:
-        chan_slope = 0.0
+    chan_slope = np.maximum(chan_slope, threshold)
+
+    if np.any(is_negative):
         warnings.warn(
             "NetworkSedimentTransporter: Negative channel slope encountered.",
             UserWarning,
         )
+        chan_slope = np.where(is_negative, 0.0, chan_slope)
 
-    elif chan_slope < threshold:
-        chan_slope = threshold
-
+    if np.ndim(chan_slope) == 0:
+        return float(chan_slope)
     return chan_slope
 
 
+def _sum_at_link(link, values, number_of_links):
+    """Sum parcel values on each link.
+
+    Parameters
+    ----------
+    link : array of int
+        Link that each parcel is in.
+    values : array
+        Value of each parcel.
+    number_of_links : int
+        Number of links in the network.
+
+    Returns
+    -------
+    array of float
+        Sum of the parcel values on each link. Links without parcels
+        are zero.
+
+    Examples
+    --------
+    >>> from landlab.components.network_sediment_transporter.network_sediment_transporter import _sum_at_link
+    >>> _sum_at_link(np.array([0, 2, 0]), np.array([1., 2., 3.]), 3)
+    array([ 4.,  0.,  2.])
+
+    The sum is a float even if there are no parcels.
+
+    >>> _sum_at_link(np.array([], dtype=int), np.array([]), 3)
+    array([ 0.,  0.,  0.])
+
+    """
+    return np.bincount(link, weights=values, minlength=number_of_links).astype(
+        float, copy=False
+    )
+
+
 def _calculate_alluvium_depth(
     stored_volume,
     width_of_upstream_links,
@@ -1048,15 +1061,17 @@ def _calculate_alluvium_depth(
 
     Parameters
     ----------
-    stored_volume : float
+    stored_volume : float or array
         Total volume of inactive parcels in this link.
-    width_of_upstream_links : float
-        Channel widths of upstream links.
-    length_of_upstream_link : float
-        Channel lengths of upstream links.
-    width_of_downstream_link : float
+    width_of_upstream_links : array
+        Channel widths of upstream links. If 2D, each row holds the upstream
+        links of one node.
+    length_of_upstream_link : array
+        Channel lengths of upstream links. If 2D, each row holds the upstream
+        links of one node.
+    width_of_downstream_link : float or array
         Channel widths of downstream links.
-    length_of_downstream_link : float
+    length_of_downstream_link : float or array
         Channel lengths of downstream links.
     porosity: float
         Channel bed sediment porosity.
@@ -1072,19 +1087,31 @@ def _calculate_alluvium_depth(
     >>> with pytest.raises(ValueError):
     ...     _calculate_alluvium_depth(24,np.array([0.1,3]),np.array([10,10]), 1, 1, 2)
 
+    Several nodes can be calculated at once.
+
+    >>> _calculate_alluvium_depth(
+    ...     np.array([100, 24]),
+    ...     np.array([[0.5, 1], [0.1, 3]]),
+    ...     np.array([[10, 10], [10, 10]]),
+    ...     np.array([1, 1]),
+    ...     np.array([10, 1]),
+    ...     0.5,
+    ... )
+    array([ 16.,   3.])
+
     """
 
     alluvium__depth = (
         2
         * stored_volume
         / (
-            np.sum(width_of_upstream_links * length_of_upstream_links)
+            np.sum(width_of_upstream_links * length_of_upstream_links, axis=-1)
             + width_of_downstream_link * length_of_downstream_link
         )
         / (1 - porosity)
     )
 
-    if alluvium__depth < 0.0:
+    if np.any(alluvium__depth < 0.0):
         raise ValueError("NST Alluvium Depth Negative")
 
     return alluvium__depth
@@ -1141,6 +1168,64 @@ def _calculate_reference_shear_stress(
     return taursg
 
 
+def _calculate_transport_rate(tau, taursg, D, mean_active_grain_size):
+    """Calculate the dimensionless transport rate (W*) of each parcel, as per
+    Wilcock and Crowe (2003).
+
+    Parameters
+    ----------
+    tau : array
+        Bed shear stress at each parcel.
+    taursg : array
+        Reference shear stress for the mean grain size of the bed surface.
+    D : array
+        Parcel grain size.
+    mean_active_grain_size : array
+        Mean grain size of the 'active' sediment parcels.
+
+    Examples
+    --------
+    >>> from landlab.components.network_sediment_transporter.network_sediment_transporter import _calculate_transport_rate
+    >>> import numpy as np
+    >>> from numpy.testing import assert_almost_equal
+
+    Below a shear stress ratio of 1.35 the transport rate follows a power
+    law,
+
+    >>> assert_almost_equal(
+    ...     _calculate_transport_rate(np.array([1.]), 1., 1., 1.), [0.002])
+
+    and above it the transport rate approaches a constant.
+
+    >>> assert_almost_equal(
+    ...     _calculate_transport_rate(np.array([2.]), 1., 1., 1.), [0.15546336])
+
+    """
+    D_ratio = D / mean_active_grain_size
+
+    b = 0.67 / (1.0 + np.exp(1.5 - D_ratio))
+
+    taur = taursg * D_ratio ** b
+    tautaur = tau / taur
+
+    # evaluate each branch of the transport function only where it applies.
+    is_high = tautaur >= 1.35
+
+    # the half-integer powers are written as integer powers times a square
+    # root, which are much cheaper to evaluate than a general power.
+    W = np.empty_like(tautaur)
+
+    x = tautaur[~is_high]
+    x3 = x * x * x
+    W[~is_high] = 0.002 * x3 * x3 * x * np.sqrt(x)
+
+    u = 1 - (0.894 / np.sqrt(tautaur[is_high]))
+    u2 = u * u
+    W[is_high] = 14 * u2 * u2 * np.sqrt(u)
+
+    return W
+
+
 def _calculate_parcel_volume_post_abrasion(
     starting_volume, travel_distance, abrasion_rate
 ):
@@ -1219,8 +1304,8 @@ def _calculate_parcel_grain_diameter_post_abrasion(
 
     """
 
-    abraded_grain_diameter = starting_diameter * (
+    abraded_grain_diameter = starting_diameter * np.cbrt(
         post_abrasion_volume / pre_abrasion_volume
-    ) ** (1.0 / 3.0)
+    )
 
     return abraded_grain_diameter
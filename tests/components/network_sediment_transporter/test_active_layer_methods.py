@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from landlab.components import NetworkSedimentTransporter
 from landlab.data_record import DataRecord
@@ -118,3 +118,50 @@ def test_constant_active_layer(example_nmg, example_parcels, example_flow_direct
     assert_array_almost_equal(
         active_layer_thickness_should_be, nst._active_layer_thickness[0]
     )
+
+
+def test_all_parcels_buried(example_nmg, example_flow_director):
+    time = [0.0]
+
+    items = {"grid_element": "link", "element_id": np.array([[6]])}
+
+    # much more sediment than the 15000 m3 a 10 cm active layer can hold
+    variables = {
+        "starting_link": (["item_id"], np.array([6])),
+        "abrasion_rate": (["item_id"], np.array([0])),
+        "density": (["item_id"], np.array([2650])),
+        "time_arrival_in_link": (["item_id", "time"], np.array([[0]])),
+        "active_layer": (["item_id", "time"], np.array([[1]])),
+        "location_in_link": (["item_id", "time"], np.array([[0]])),
+        "D": (["item_id", "time"], np.array([[0.05]])),
+        "volume": (["item_id", "time"], np.array([[20000]])),
+    }
+
+    one_parcel = DataRecord(
+        example_nmg,
+        items=items,
+        time=time,
+        data_vars=variables,
+        dummy_elements={"link": [NetworkSedimentTransporter.OUT_OF_NETWORK]},
+    )
+
+    nst = NetworkSedimentTransporter(
+        example_nmg,
+        one_parcel,
+        example_flow_director,
+        bed_porosity=0.03,
+        g=9.81,
+        fluid_density=1000,
+        transport_method="WilcockCrowe",
+        active_layer_method="Constant10cm",
+    )
+
+    nst.run_one_step(60)
+
+    assert_array_equal(one_parcel.dataset.active_layer.values[:, -1], [0])
+    assert_array_equal(one_parcel.dataset.element_id.values[:, -1], [6])
+    assert_array_equal(one_parcel.dataset.location_in_link.values[:, -1], [0.0])
+    assert_array_equal(nst._pvelocity, [0.0])
+
+    assert example_nmg.at_link["sediment__active__volume"].dtype == float
+    assert_array_equal(example_nmg.at_link["sediment__active__volume"], 0.0)
@@ -55,3 +55,55 @@ def test_parcel_leaves(example_nmg, example_flow_director):
     with pytest.raises(RuntimeError):
         for t in range(timesteps):
             nst.run_one_step(dt)
+
+
+def test_inactive_parcel_stays_in_outlet_link(example_nmg, example_flow_director):
+
+    example_nmg.at_link["reach_length"] = ([10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0],)
+
+    time = [0.0]
+
+    items = {"grid_element": "link", "element_id": np.array([[0], [0]])}
+
+    variables = {
+        "starting_link": (["item_id"], np.array([0, 0])),
+        "abrasion_rate": (["item_id"], np.array([0.0, 0.0])),
+        "density": (["item_id"], np.array([2650, 2650])),
+        "time_arrival_in_link": (["item_id", "time"], np.array([[0.9], [0.1]])),
+        "active_layer": (["item_id", "time"], np.array([[1], [1]])),
+        "location_in_link": (["item_id", "time"], np.array([[0.0], [0.5]])),
+        "D": (["item_id", "time"], np.array([[0.05], [0.05]])),
+        "volume": (["item_id", "time"], np.array([[1.0], [100.0]])),
+    }
+
+    two_parcels = DataRecord(
+        example_nmg,
+        items=items,
+        time=time,
+        data_vars=variables,
+        dummy_elements={"link": [NetworkSedimentTransporter.OUT_OF_NETWORK]},
+    )
+
+    example_nmg.at_link["flow_depth"] = example_nmg.at_link["flow_depth"] * 20
+
+    nst = NetworkSedimentTransporter(
+        example_nmg,
+        two_parcels,
+        example_flow_director,
+        bed_porosity=0.03,
+        g=9.81,
+        fluid_density=1000,
+        transport_method="WilcockCrowe",
+        active_layer_method="Constant10cm",
+    )
+
+    nst.run_one_step(60 * 60 * 24)
+
+    # the young parcel leaves the network while the buried parcel, which is
+    # too deep in the outlet link to be active, stays where it was.
+    assert two_parcels.dataset.element_id.values[0, -1] == (
+        NetworkSedimentTransporter.OUT_OF_NETWORK
+    )
+    assert two_parcels.dataset.active_layer.values[1, -1] == 0
+    assert two_parcels.dataset.element_id.values[1, -1] == 0
+    assert two_parcels.dataset.location_in_link.values[1, -1] == 0.5
@@ -142,3 +142,70 @@ def test_add_pulse():
     assert_array_almost_equal(
         Parcel_element_id_Should_Be, Parcel_element_id, decimal=-1
     )
+
+
+def test_distance_traveled_after_pulse():
+    nmg = NetworkModelGrid(((0, 0, 0, 0), (0, 100, 200, 300)), ((0, 1), (1, 2), (2, 3)))
+    nmg.at_node["topographic__elevation"] = [3.0, 2.0, 1.0, 0.0]
+    nmg.at_node["bedrock__elevation"] = [3.0, 2.0, 1.0, 0.0]
+    nmg.at_link["reach_length"] = [100.0, 100.0, 100.0]
+    nmg.at_link["channel_width"] = 15 * np.ones(nmg.size("link"))
+    nmg.at_link["flow_depth"] = 2 * np.ones(nmg.size("link"))
+
+    flow_director = FlowDirectorSteepest(nmg)
+    flow_director.run_one_step()
+
+    def parcel_variables(n_parcels, time):
+        return {
+            "starting_link": (["item_id"], np.zeros(n_parcels, dtype=int)),
+            "abrasion_rate": (["item_id"], np.zeros(n_parcels)),
+            "density": (["item_id"], 2650 * np.ones(n_parcels)),
+            "time_arrival_in_link": (
+                ["item_id", "time"],
+                time * np.ones((n_parcels, 1)),
+            ),
+            "active_layer": (["item_id", "time"], np.ones((n_parcels, 1))),
+            "location_in_link": (["item_id", "time"], np.zeros((n_parcels, 1))),
+            "D": (["item_id", "time"], 0.05 * np.ones((n_parcels, 1))),
+            "volume": (["item_id", "time"], np.ones((n_parcels, 1))),
+        }
+
+    parcels = DataRecord(
+        nmg,
+        items={"grid_element": "link", "element_id": np.array([[0]])},
+        time=[0.0],
+        data_vars=parcel_variables(1, 0.0),
+        dummy_elements={"link": [NetworkSedimentTransporter.OUT_OF_NETWORK]},
+    )
+
+    nst = NetworkSedimentTransporter(
+        nmg,
+        parcels,
+        flow_director,
+        bed_porosity=0.03,
+        g=9.81,
+        fluid_density=1000,
+        transport_method="WilcockCrowe",
+    )
+
+    dt = 60
+    nst.run_one_step(dt)
+    distance_before_pulse = nst._distance_traveled_cumulative.copy()
+
+    grid_element = np.empty((2, 1), dtype=object)
+    grid_element.fill("link")
+    parcels.add_item(
+        time=[nst._time],
+        new_item={
+            "grid_element": grid_element,
+            "element_id": np.zeros((2, 1), dtype=int),
+        },
+        new_item_spec=parcel_variables(2, nst._time),
+    )
+
+    nst.run_one_step(dt)
+
+    expected = nst._pvelocity * dt
+    expected[0] += distance_before_pulse[0]
+    assert distance_before_pulse[0] > 0.0
+    assert_array_almost_equal(nst._distance_traveled_cumulative, expected)